@@ -1,17 +1,85 @@
+import hashlib
 import streamlit as st
+import numpy as np
 from datetime import datetime, timedelta
-from processors.tle_fetcher import fetch_multiple_catalogs, CATALOGS, is_using_fallback
-from processors.orbit_propagator import propagate_multiple, get_current_position
+from processors.tle_fetcher import fetch_multiple_catalogs_with_status, CATALOGS
+from processors.orbit_propagator import propagate_multiple, get_current_positions, parse_satellites
 from processors.conjunction_detector import find_conjunctions, assess_collision_risk, get_risk_color
 from processors.visualization import create_3d_visualization
 from processors.debris_density import (
     calculate_small_debris_risk, 
+    calculate_small_debris_risk_batch,
     get_debris_environment_summary,
     get_risk_color as get_density_risk_color,
     DEBRIS_ZONES,
     KNOWN_DEBRIS_CLUSTERS
 )
 
+class _DemoDataResult(Exception):
+    """Carries a demo-data fetch out of the cache; st.cache_data never stores raised results."""
+    def __init__(self, satellites):
+        super().__init__()
+        self.satellites = satellites
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def _load_live_satellites(catalogs, limit_per_catalog):
+    """Fetch TLEs for the selected catalogs; only fully live results are cached."""
+    satellites, using_fallback = fetch_multiple_catalogs_with_status(
+        list(catalogs), limit_per_catalog=limit_per_catalog
+    )
+    if using_fallback:
+        raise _DemoDataResult(satellites)
+    return satellites
+
+def load_satellites(catalogs, limit_per_catalog):
+    """
+    Returns (satellites, using_fallback). Live results are reused across
+    reruns; demo data is not cached, so the next run retries the network.
+    """
+    try:
+        return _load_live_satellites(catalogs, limit_per_catalog), False
+    except _DemoDataResult as demo:
+        return demo.satellites, True
+
+def load_parsed_satellites(satellites):
+    """Parsed TLEs for this satellite set, kept in session state across reruns."""
+    digest = hashlib.blake2b(digest_size=16)
+    for sat in satellites:
+        for field in (sat['name'], sat.get('catalog', 'unknown'), sat['line1'], sat['line2']):
+            digest.update(field.encode())
+            digest.update(b'\0')
+    tle_hash = digest.hexdigest()
+    
+    if st.session_state.get('tle_hash') != tle_hash:
+        st.session_state.parsed_satellites = parse_satellites(satellites)
+        st.session_state.tle_hash = tle_hash
+    return st.session_state.parsed_satellites
+
+# Arguments with a leading underscore are excluded from the cache key; the
+# parsed TLEs are fully determined by satellites.
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def load_propagation(satellites, start_time, duration_hours, _parsed=None):
+    """Propagate orbit traces for the visualization, reused across reruns."""
+    return propagate_multiple(
+        satellites,
+        start_time=start_time,
+        duration_hours=duration_hours,
+        step_minutes=10,
+        parsed=_parsed
+    )
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def load_conjunctions(satellites, start_time, duration_hours, threshold_km, _parsed=None):
+    """Screen for close approaches, reused across reruns."""
+    return find_conjunctions(
+        satellites,
+        threshold_km=threshold_km,
+        duration_hours=duration_hours,
+        step_minutes=15,
+        start_time=start_time,
+        parsed=_parsed
+    )
+
 st.set_page_config(page_title="Space Debris Tracker", layout="wide")
 
 st.title("🛰️ Space Debris & Collision Monitor")
@@ -46,44 +114,28 @@ if run_analysis:
         st.warning("Please select at least one object type to track.")
     else:
         with st.spinner("Fetching orbital data..."):
-            satellites = fetch_multiple_catalogs(catalogs, limit_per_catalog=objects_per_type)
+            satellites, using_fallback = load_satellites(tuple(catalogs), objects_per_type)
         
         if not satellites:
             st.error("Could not fetch satellite data. Please try again.")
         else:
-            if is_using_fallback():
+            if using_fallback:
                 st.info(f"📡 Demo Mode: Using realistic sample orbital data ({len(satellites)} objects). External TLE sources are not accessible from this environment.")
             else:
                 st.success(f"✅ Loaded {len(satellites)} objects from live orbital data")
             
+            parsed = load_parsed_satellites(satellites)
+            
+            # Whole minutes, so reruns within the same minute hit the cache
+            start_time = datetime.utcnow().replace(second=0, microsecond=0)
+            
             with st.spinner("Propagating orbits..."):
-                propagation_results = propagate_multiple(
-                    satellites, 
-                    duration_hours=prediction_hours,
-                    step_minutes=10
-                )
-            
-            current_positions = []
-            for sat in satellites:
-                try:
-                    pos = get_current_position(sat)
-                    if pos:
-                        current_positions.append({
-                            'name': sat['name'],
-                            'catalog': sat.get('catalog', 'unknown'),
-                            'position': pos['position'],
-                            'altitude_km': pos['altitude_km']
-                        })
-                except:
-                    pass
+                propagation_results = load_propagation(satellites, start_time, prediction_hours, parsed)
+            
+            current_positions = get_current_positions(satellites, parsed=parsed)
             
             with st.spinner("Analyzing potential collisions..."):
-                conjunctions = find_conjunctions(
-                    satellites,
-                    threshold_km=collision_threshold,
-                    duration_hours=prediction_hours,
-                    step_minutes=15
-                )
+                conjunctions = load_conjunctions(satellites, start_time, prediction_hours, collision_threshold, parsed)
             
             st.header("3D Orbital Visualization")
             fig = create_3d_visualization(propagation_results, current_positions, conjunctions)
@@ -133,9 +185,12 @@ if run_analysis:
             st.header("Small Debris Risk Assessment")
             st.markdown("**Risk of collision with untracked debris (1-10cm) that cannot be individually monitored:**")
             
-            if current_positions:
-                altitudes = [p['altitude_km'] for p in current_positions]
-                unique_altitudes = sorted(set([int(a/50)*50 for a in altitudes]))[:10]
+            names = current_positions['names']
+            position_catalogs = current_positions['catalogs']
+            altitudes = current_positions['altitudes']
+            
+            if len(altitudes):
+                unique_altitudes = np.unique(np.trunc(altitudes / 50).astype(int) * 50)[:10]
                 
                 for alt in unique_altitudes:
                     risk_data = calculate_small_debris_risk(alt)
@@ -175,37 +230,42 @@ if run_analysis:
             
             st.header("Tracked Objects")
             
-            stations = [p for p in current_positions if p['catalog'] == 'stations']
-            starlinks = [p for p in current_positions if p['catalog'] == 'starlink']
-            debris = [p for p in current_positions if 'debris' in p['catalog']]
+            station_mask = position_catalogs == 'stations'
+            starlink_mask = position_catalogs == 'starlink'
+            debris_mask = np.char.find(position_catalogs.astype(str), 'debris') >= 0
             
             tab1, tab2, tab3 = st.tabs(["Space Stations", "Starlink", "Debris"])
             
             with tab1:
-                if stations:
-                    for sat in stations:
-                        risk = calculate_small_debris_risk(sat['altitude_km'])
-                        st.markdown(f"🟢 **{sat['name']}** - Altitude: {sat['altitude_km']:.0f} km - Small debris risk: {risk['risk_level']}")
+                if station_mask.any():
+                    shown_alts = altitudes[station_mask]
+                    risk_levels = calculate_small_debris_risk_batch(shown_alts)['risk_level']
+                    for name, altitude, risk_level in zip(names[station_mask], shown_alts, risk_levels):
+                        st.markdown(f"🟢 **{name}** - Altitude: {altitude:.0f} km - Small debris risk: {risk_level}")
                 else:
                     st.info("No space stations tracked")
             
             with tab2:
-                if starlinks:
-                    for sat in starlinks[:20]:
-                        risk = calculate_small_debris_risk(sat['altitude_km'])
-                        st.markdown(f"🟡 **{sat['name']}** - Altitude: {sat['altitude_km']:.0f} km - Small debris risk: {risk['risk_level']}")
-                    if len(starlinks) > 20:
-                        st.caption(f"...and {len(starlinks) - 20} more")
+                starlink_count = np.count_nonzero(starlink_mask)
+                if starlink_count:
+                    shown_alts = altitudes[starlink_mask][:20]
+                    risk_levels = calculate_small_debris_risk_batch(shown_alts)['risk_level']
+                    for name, altitude, risk_level in zip(names[starlink_mask][:20], shown_alts, risk_levels):
+                        st.markdown(f"🟡 **{name}** - Altitude: {altitude:.0f} km - Small debris risk: {risk_level}")
+                    if starlink_count > 20:
+                        st.caption(f"...and {starlink_count - 20} more")
                 else:
                     st.info("No Starlink satellites tracked")
             
             with tab3:
-                if debris:
-                    for sat in debris[:20]:
-                        risk = calculate_small_debris_risk(sat['altitude_km'])
-                        st.markdown(f"🔴 **{sat['name']}** - Altitude: {sat['altitude_km']:.0f} km - Small debris risk: {risk['risk_level']}")
-                    if len(debris) > 20:
-                        st.caption(f"...and {len(debris) - 20} more")
+                debris_count = np.count_nonzero(debris_mask)
+                if debris_count:
+                    shown_alts = altitudes[debris_mask][:20]
+                    risk_levels = calculate_small_debris_risk_batch(shown_alts)['risk_level']
+                    for name, altitude, risk_level in zip(names[debris_mask][:20], shown_alts, risk_levels):
+                        st.markdown(f"🔴 **{name}** - Altitude: {altitude:.0f} km - Small debris risk: {risk_level}")
+                    if debris_count > 20:
+                        st.caption(f"...and {debris_count - 20} more")
                 else:
                     st.info("No debris tracked")
 
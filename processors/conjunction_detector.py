@@ -1,56 +1,163 @@
+import math
 import numpy as np
-from datetime import datetime, timedelta
-from .orbit_propagator import get_current_position
+from datetime import datetime
+from scipy.spatial import cKDTree
+from .orbit_propagator import propagate_batch, EARTH_RADIUS_KM
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Padding on the screening radius so float32 rounding can't drop a borderline hit
+SCREEN_MARGIN_KM = 0.01
+
+# Above this many objects the all-pairs screen is replaced by a KD-tree query
+KDTREE_MIN_OBJECTS = 200
+
+RISK_COLORS = {
+    "CRITICAL": "#FF0000",
+    "HIGH": "#FF4500",
+    "ELEVATED": "#FFA500",
+    "MODERATE": "#FFD700",
+    "LOW": "#90EE90",
+    "MINIMAL": "#00FF00"
+}
 
 def calculate_distance(pos1, pos2):
     """Calculate Euclidean distance between two positions in km."""
-    return np.sqrt(sum((a - b) ** 2 for a, b in zip(pos1, pos2)))
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1], pos1[2] - pos2[2])
+
+def _shell_candidate_pairs(radii, screen_km):
+    """
+    Pairs (i, j), i < j, whose geocentric radius ranges over the whole window
+    come within screen_km of each other. Pairs in disjoint altitude shells
+    can never be closer than the gap between the shells.
+    """
+    r_min = np.fmin.reduce(radii, axis=1)
+    r_max = np.fmax.reduce(radii, axis=1)
+    overlap = (r_min[:, None] <= r_max[None, :] + screen_km) & (r_max[:, None] + screen_km >= r_min[None, :])
+    return np.nonzero(np.triu(overlap, k=1))
+
+if numba is not None:
+    # No fastmath: positions that failed SGP4 are NaN and must compare False
+    @numba.njit(parallel=True, cache=True)
+    def _screen_pairs_jit(positions, pair_i, pair_j, screen_sq):
+        """Compiled pair screen; counts hits per pair, then fills preallocated outputs."""
+        n_pairs = len(pair_i)
+        n_steps = positions.shape[1]
+        
+        counts = np.zeros(n_pairs, dtype=np.int64)
+        for p in numba.prange(n_pairs):
+            i, j = pair_i[p], pair_j[p]
+            count = 0
+            for t in range(n_steps):
+                dx = positions[i, t, 0] - positions[j, t, 0]
+                dy = positions[i, t, 1] - positions[j, t, 1]
+                dz = positions[i, t, 2] - positions[j, t, 2]
+                if dx * dx + dy * dy + dz * dz < screen_sq:
+                    count += 1
+            counts[p] = count
+        
+        offsets = np.zeros(n_pairs + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        hit_i = np.empty(offsets[-1], dtype=np.int64)
+        hit_j = np.empty(offsets[-1], dtype=np.int64)
+        hit_steps = np.empty(offsets[-1], dtype=np.int64)
+        
+        for p in numba.prange(n_pairs):
+            i, j = pair_i[p], pair_j[p]
+            k = offsets[p]
+            for t in range(n_steps):
+                dx = positions[i, t, 0] - positions[j, t, 0]
+                dy = positions[i, t, 1] - positions[j, t, 1]
+                dz = positions[i, t, 2] - positions[j, t, 2]
+                if dx * dx + dy * dy + dz * dz < screen_sq:
+                    hit_i[k] = i
+                    hit_j[k] = j
+                    hit_steps[k] = t
+                    k += 1
+        
+        return hit_i, hit_j, hit_steps
+else:
+    _screen_pairs_jit = None
 
-def find_conjunctions(satellites, threshold_km=50, duration_hours=24, step_minutes=5):
+def _screen_pairs(positions, pair_i, pair_j, screen_km):
+    """
+    Candidate (i, j, step) hits for the given pairs at every step. Uses the
+    compiled kernel when numba is installed, otherwise one float32 NumPy pass
+    (ample for a km-scale threshold).
+    """
+    if _screen_pairs_jit is not None:
+        return _screen_pairs_jit(
+            np.ascontiguousarray(positions, dtype=np.float64),
+            pair_i.astype(np.int64), pair_j.astype(np.int64), float(screen_km) ** 2
+        )
+    
+    positions32 = positions.astype(np.float32)
+    diff = positions32[pair_i] - positions32[pair_j]
+    dist_sq = np.einsum('ptk,ptk->pt', diff, diff)
+    hit_pairs, hit_steps = np.nonzero(dist_sq < screen_km ** 2)
+    return pair_i[hit_pairs], pair_j[hit_pairs], hit_steps
+
+def _screen_kdtree(positions, screen_km):
+    """
+    Candidate (i, j, step) hits from a KD-tree pair query per step, which
+    scales with the number of close pairs rather than all N^2 pairs.
+    """
+    hit_i, hit_j, hit_steps = [], [], []
+    for step in range(positions.shape[1]):
+        step_positions = positions[:, step]
+        valid = np.flatnonzero(~np.isnan(step_positions[:, 0]))
+        pairs = cKDTree(step_positions[valid]).query_pairs(r=screen_km, output_type='ndarray')
+        hit_i.append(valid[pairs[:, 0]])
+        hit_j.append(valid[pairs[:, 1]])
+        hit_steps.append(np.full(len(pairs), step))
+    if not hit_steps:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    return np.concatenate(hit_i), np.concatenate(hit_j), np.concatenate(hit_steps)
+
+def find_conjunctions(satellites, threshold_km=50, duration_hours=24, step_minutes=5, start_time=None, parsed=None):
     """
     Find close approaches between satellites.
     Returns list of conjunction events.
     """
-    start_time = datetime.utcnow()
-    steps = int((duration_hours * 60) / step_minutes)
+    if start_time is None:
+        start_time = datetime.utcnow()
+    batch = propagate_batch(satellites, start_time, duration_hours, step_minutes, parsed)
+    
+    names = batch['names']
+    positions = batch['positions']
+    if positions.shape[1] == 0:
+        return []
+    radii = np.linalg.norm(positions, axis=-1)
+    altitudes = radii - EARTH_RADIUS_KM
+    screen_km = threshold_km + SCREEN_MARGIN_KM
+    if len(names) >= KDTREE_MIN_OBJECTS:
+        hit_i, hit_j, hit_steps = _screen_kdtree(positions, screen_km)
+    else:
+        pair_i, pair_j = _shell_candidate_pairs(radii, screen_km)
+        hit_i, hit_j, hit_steps = _screen_pairs(positions, pair_i, pair_j, screen_km)
+    
+    # Exact float64 distances for the screened candidates only
+    distances = np.linalg.norm(
+        positions[hit_i, hit_steps] - positions[hit_j, hit_steps], axis=-1
+    )
+    close = distances < threshold_km
     
     conjunctions = []
     
-    for step in range(steps):
-        current_time = start_time + timedelta(minutes=step * step_minutes)
-        
-        positions = []
-        for sat in satellites:
-            try:
-                pos_data = get_current_position(sat, current_time)
-                if pos_data:
-                    positions.append({
-                        'name': sat['name'],
-                        'catalog': sat.get('catalog', 'unknown'),
-                        'position': pos_data['position'],
-                        'altitude_km': pos_data['altitude_km'],
-                        'time': current_time
-                    })
-            except:
-                continue
-        
-        for i in range(len(positions)):
-            for j in range(i + 1, len(positions)):
-                dist = calculate_distance(
-                    positions[i]['position'],
-                    positions[j]['position']
-                )
-                
-                if dist < threshold_km:
-                    conjunctions.append({
-                        'object1': positions[i]['name'],
-                        'object2': positions[j]['name'],
-                        'distance_km': round(dist, 2),
-                        'time': current_time,
-                        'time_from_now': current_time - start_time,
-                        'altitude1_km': round(positions[i]['altitude_km'], 1),
-                        'altitude2_km': round(positions[j]['altitude_km'], 1),
-                    })
+    for i, j, step, dist in zip(hit_i[close], hit_j[close], hit_steps[close], distances[close]):
+        current_time = batch['times'][step]
+        conjunctions.append({
+            'object1': names[i],
+            'object2': names[j],
+            'distance_km': round(dist, 2),
+            'time': current_time,
+            'time_from_now': current_time - start_time,
+            'altitude1_km': round(altitudes[i, step], 1),
+            'altitude2_km': round(altitudes[j, step], 1),
+        })
     
     conjunctions.sort(key=lambda x: x['distance_km'])
     
@@ -73,12 +180,4 @@ def assess_collision_risk(distance_km):
 
 def get_risk_color(risk_level):
     """Get color for risk level."""
-    colors = {
-        "CRITICAL": "#FF0000",
-        "HIGH": "#FF4500", 
-        "ELEVATED": "#FFA500",
-        "MODERATE": "#FFD700",
-        "LOW": "#90EE90",
-        "MINIMAL": "#00FF00"
-    }
-    return colors.get(risk_level, "#FFFFFF")
+    return RISK_COLORS.get(risk_level, "#FFFFFF")
@@ -7,6 +7,10 @@ based on orbital altitude, inclination, and known debris concentrations.
 Based on NASA and ESA debris environment models.
 """
 
+import bisect
+import math
+from functools import lru_cache
+
 import numpy as np
 
 DEBRIS_ZONES = {
@@ -91,17 +95,47 @@ KNOWN_DEBRIS_CLUSTERS = [
     }
 ]
 
+_ZONE_BOUNDS = sorted((zone["alt_min"], zone["alt_max"], key) for key, zone in DEBRIS_ZONES.items())
+_ZONE_MINS = [alt_min for alt_min, _, _ in _ZONE_BOUNDS]
+
+UNKNOWN_ZONE = {"name": "Unknown", "density_factor": 0.1, "small_debris_flux": 0.00001}
+
+# Per-zone lookup arrays for the batch path, in _ZONE_BOUNDS order with the
+# unknown zone appended as the final slot
+_ZONE_TABLE = [DEBRIS_ZONES[key] for _, _, key in _ZONE_BOUNDS] + [UNKNOWN_ZONE]
+_ZONE_MIN_ARRAY = np.array(_ZONE_MINS, dtype=float)
+_ZONE_MAX_ARRAY = np.array([alt_max for _, alt_max, _ in _ZONE_BOUNDS], dtype=float)
+_ZONE_KEYS = np.array([key for _, _, key in _ZONE_BOUNDS] + ["UNKNOWN"], dtype=object)
+_ZONE_NAMES = np.array([zone["name"] for zone in _ZONE_TABLE], dtype=object)
+_ZONE_DESCRIPTIONS = np.array([zone.get("description", "") for zone in _ZONE_TABLE], dtype=object)
+_ZONE_FLUX = np.array([zone["small_debris_flux"] for zone in _ZONE_TABLE])
+_ZONE_DENSITY = np.array([zone["density_factor"] for zone in _ZONE_TABLE])
+_CLUSTER_ALTITUDES = np.array([c["altitude_km"] for c in KNOWN_DEBRIS_CLUSTERS], dtype=float)
+
+# Risk buckets by collision probability: a probability strictly above
+# _RISK_PROB_EDGES[k] falls in bucket k + 1
+_RISK_PROB_EDGES = np.array([0.00001, 0.0001, 0.001, 0.01])
+_RISK_LEVELS = np.array(["LOW", "MODERATE", "ELEVATED", "HIGH", "CRITICAL"], dtype=object)
+_RISK_SCORES = np.array([10, 30, 50, 70, 90])
+_RISK_COLORS = np.array(["#00FF00", "#FFD700", "#FFA500", "#FF4500", "#FF0000"], dtype=object)
+_RISK_COLOR_BY_LEVEL = dict(zip(_RISK_LEVELS, _RISK_COLORS))
+
 def get_altitude_zone(altitude_km):
     """Determine which debris zone an altitude falls into."""
-    for zone_key, zone in DEBRIS_ZONES.items():
-        if zone["alt_min"] <= altitude_km < zone["alt_max"]:
-            return zone_key, zone
-    return "UNKNOWN", {"name": "Unknown", "density_factor": 0.1, "small_debris_flux": 0.00001}
+    idx = bisect.bisect_right(_ZONE_MINS, altitude_km) - 1
+    if idx >= 0:
+        _, alt_max, zone_key = _ZONE_BOUNDS[idx]
+        if altitude_km < alt_max:
+            return zone_key, DEBRIS_ZONES[zone_key]
+    return "UNKNOWN", UNKNOWN_ZONE
 
 def calculate_small_debris_risk(altitude_km, cross_section_m2=10, exposure_years=1):
     """
     Calculate probability of collision with untracked small debris.
     
+    Altitudes are quantized to the nearest kilometer so that satellites in
+    the same shell share one cached assessment.
+    
     Args:
         altitude_km: Orbital altitude in kilometers
         cross_section_m2: Target cross-sectional area in square meters
@@ -110,6 +144,16 @@ def calculate_small_debris_risk(altitude_km, cross_section_m2=10, exposure_years
     Returns:
         dict with risk assessment
     """
+    if math.isfinite(altitude_km):
+        risk = _small_debris_risk(round(altitude_km), cross_section_m2, exposure_years)
+    else:
+        # NaN/inf can't be rounded and would only pollute the cache
+        risk = _small_debris_risk.__wrapped__(altitude_km, cross_section_m2, exposure_years)
+    return {**risk, "altitude_km": altitude_km, "nearby_clusters": list(risk["nearby_clusters"])}
+
+@lru_cache(maxsize=512)
+def _small_debris_risk(altitude_km, cross_section_m2, exposure_years):
+    """Cached risk assessment for a quantized altitude; see calculate_small_debris_risk."""
     zone_key, zone = get_altitude_zone(altitude_km)
     
     base_flux = zone["small_debris_flux"]
@@ -122,21 +166,9 @@ def calculate_small_debris_risk(altitude_km, cross_section_m2=10, exposure_years
     
     collision_probability = base_flux * cross_section_m2 * exposure_years * proximity_boost
     
-    if collision_probability > 0.01:
-        risk_level = "CRITICAL"
-        risk_score = 90
-    elif collision_probability > 0.001:
-        risk_level = "HIGH"
-        risk_score = 70
-    elif collision_probability > 0.0001:
-        risk_level = "ELEVATED"
-        risk_score = 50
-    elif collision_probability > 0.00001:
-        risk_level = "MODERATE"
-        risk_score = 30
-    else:
-        risk_level = "LOW"
-        risk_score = 10
+    level_idx = np.searchsorted(_RISK_PROB_EDGES, collision_probability)
+    risk_level = _RISK_LEVELS[level_idx]
+    risk_score = int(_RISK_SCORES[level_idx])
     
     return {
         "altitude_km": altitude_km,
@@ -151,6 +183,41 @@ def calculate_small_debris_risk(altitude_km, cross_section_m2=10, exposure_years
                           if abs(altitude_km - c["altitude_km"]) < 150]
     }
 
+def calculate_small_debris_risk_batch(altitudes_km, cross_section_m2=10, exposure_years=1):
+    """
+    Vectorized calculate_small_debris_risk over an array of altitudes.
+    
+    Returns:
+        dict of arrays with one entry per altitude (nearby_clusters omitted)
+    """
+    altitudes = np.asarray(altitudes_km, dtype=float)
+    binned = np.round(altitudes)
+    
+    idx = np.searchsorted(_ZONE_MIN_ARRAY, binned, side='right') - 1
+    in_zone = (idx >= 0) & (binned < _ZONE_MAX_ARRAY[idx])
+    idx = np.where(in_zone, idx, len(_ZONE_TABLE) - 1)
+    
+    proximity_boost = np.ones_like(binned)
+    for cluster_alt in _CLUSTER_ALTITUDES:
+        alt_diff = np.abs(binned - cluster_alt)
+        proximity_boost += np.where(alt_diff < 100, (100 - alt_diff) / 100 * 0.5, 0.0)
+    
+    collision_probability = _ZONE_FLUX[idx] * cross_section_m2 * exposure_years * proximity_boost
+    
+    level_idx = np.searchsorted(_RISK_PROB_EDGES, collision_probability)
+    
+    return {
+        "altitude_km": altitudes,
+        "zone": _ZONE_NAMES[idx],
+        "zone_key": _ZONE_KEYS[idx],
+        "zone_description": _ZONE_DESCRIPTIONS[idx],
+        "collision_probability": collision_probability,
+        "risk_level": _RISK_LEVELS[level_idx],
+        "risk_score": _RISK_SCORES[level_idx],
+        "risk_color": _RISK_COLORS[level_idx],
+        "density_factor": _ZONE_DENSITY[idx]
+    }
+
 def get_debris_environment_summary():
     """Get summary of the debris environment."""
     total_tracked = sum(c["tracked_fragments"] for c in KNOWN_DEBRIS_CLUSTERS)
@@ -167,11 +234,4 @@ def get_debris_environment_summary():
 
 def get_risk_color(risk_level):
     """Get color for risk level visualization."""
-    colors = {
-        "CRITICAL": "#FF0000",
-        "HIGH": "#FF4500",
-        "ELEVATED": "#FFA500",
-        "MODERATE": "#FFD700",
-        "LOW": "#00FF00"
-    }
-    return colors.get(risk_level, "#FFFFFF")
+    return _RISK_COLOR_BY_LEVEL.get(risk_level, "#FFFFFF")
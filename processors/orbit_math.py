@@ -1,34 +1,27 @@
+import math
 from astropy.time import Time
 import numpy as np
 
+def _stack(lines):
+    """Stack line segments ((x0, y0), (x1, y1)) into an (n, 2, 2) endpoint array."""
+    return np.asarray(lines, dtype=float).reshape(-1, 2, 2)
+
 def get_streak_centroid(lines):
     """Calculate the average centroid of all detected streaks."""
-    if not lines:
+    arr = _stack(lines)
+    if len(arr) == 0:
         return None
     
-    centroids = []
-    for line in lines:
-        p0, p1 = line
-        cx = (p0[0] + p1[0]) / 2
-        cy = (p0[1] + p1[1]) / 2
-        centroids.append((cx, cy))
-    
-    avg_x = np.mean([c[0] for c in centroids])
-    avg_y = np.mean([c[1] for c in centroids])
+    avg_x, avg_y = arr.mean(axis=(0, 1))
     return (avg_x, avg_y)
 
 def get_longest_streak_length(lines):
     """Get the length of the longest detected streak."""
-    if not lines:
+    arr = _stack(lines)
+    if len(arr) == 0:
         return 0
     
-    max_len = 0
-    for line in lines:
-        p0, p1 = line
-        length = np.sqrt((p1[0]-p0[0])**2 + (p1[1]-p0[1])**2)
-        if length > max_len:
-            max_len = length
-    return max_len
+    return np.max(np.hypot(arr[:, 1, 0] - arr[:, 0, 0], arr[:, 1, 1] - arr[:, 0, 1]))
 
 def check_impact_risk(header1, header2, lines1, lines2):
     """
@@ -52,6 +45,9 @@ def check_impact_risk(header1, header2, lines1, lines2):
     if delta_t == 0:
         return "Simultaneous Frames", 0, {}
 
+    lines1 = _stack(lines1)
+    lines2 = _stack(lines2)
+    
     centroid1 = get_streak_centroid(lines1)
     centroid2 = get_streak_centroid(lines2)
     
@@ -61,7 +57,7 @@ def check_impact_risk(header1, header2, lines1, lines2):
     
     inter_frame_motion = 0
     if centroid1 and centroid2:
-        inter_frame_motion = np.sqrt((centroid2[0]-centroid1[0])**2 + (centroid2[1]-centroid1[1])**2)
+        inter_frame_motion = math.hypot(centroid2[0] - centroid1[0], centroid2[1] - centroid1[1])
     
     pixel_scale = 2.0
     
@@ -1,54 +1,150 @@
-from sgp4.api import Satrec, jday
+import math
+from sgp4.api import Satrec, SatrecArray, jday
 from datetime import datetime, timedelta
+from functools import lru_cache
 import numpy as np
 
 EARTH_RADIUS_KM = 6371.0
 
+def _get_satrec(tle_data):
+    """Parse a TLE into a Satrec, reusing the parsed object for repeated TLEs."""
+    return _parse_tle(tle_data['line1'], tle_data['line2'])
+
+# Bounded so refreshed TLEs (new epochs several times a day) don't
+# accumulate in a long-running server
+@lru_cache(maxsize=4096)
+def _parse_tle(line1, line2):
+    """Cached body of _get_satrec."""
+    return Satrec.twoline2rv(line1, line2)
+
+def compute_jd_grid(start_time, steps, step_minutes):
+    """
+    Julian date arrays (jd, fr) for evenly spaced steps from start_time.
+    Timelines are cached and shared by every caller; the arrays are read-only.
+    """
+    # jday() takes whole seconds, so dropping microseconds doesn't change the
+    # result but lets nearby calls share a cache entry
+    return _cached_jd_grid(start_time.replace(microsecond=0), steps, step_minutes)
+
+@lru_cache(maxsize=64)
+def _cached_jd_grid(start_time, steps, step_minutes):
+    """Cached body of compute_jd_grid."""
+    jd, fr = jday(
+        start_time.year, start_time.month, start_time.day,
+        start_time.hour, start_time.minute, start_time.second
+    )
+    offsets = np.arange(steps) * (step_minutes / 1440.0)
+    jd_grid = np.full(steps, jd)
+    fr_grid = fr + offsets
+    jd_grid.setflags(write=False)
+    fr_grid.setflags(write=False)
+    return jd_grid, fr_grid
+
 def propagate_satellite(tle_data, start_time=None, duration_hours=24, step_minutes=10):
     """
     Propagate a satellite orbit using SGP4.
-    Returns list of positions in ECI coordinates (km).
+    Returns positions in ECI coordinates (km) as a float32 (n_steps, 3) array.
     """
-    satellite = Satrec.twoline2rv(tle_data['line1'], tle_data['line2'])
+    satellite = _get_satrec(tle_data)
     
     if start_time is None:
         start_time = datetime.utcnow()
     
-    positions = []
-    times = []
-    
     steps = int((duration_hours * 60) / step_minutes)
     
-    for i in range(steps):
-        current_time = start_time + timedelta(minutes=i * step_minutes)
-        jd, fr = jday(
-            current_time.year, current_time.month, current_time.day,
-            current_time.hour, current_time.minute, current_time.second
-        )
-        
-        error, position, velocity = satellite.sgp4(jd, fr)
-        
-        if error == 0:
-            positions.append(position)
-            times.append(current_time)
+    jd, fr = compute_jd_grid(start_time, steps, step_minutes)
+    errors, positions, velocities = satellite.sgp4_array(jd, fr)
+    ok = np.flatnonzero(errors == 0).tolist()
     
     return {
         'name': tle_data['name'],
         'catalog': tle_data.get('catalog', 'unknown'),
-        'positions': positions,
-        'times': times
+        'positions': positions[ok].astype(np.float32),
+        'times': [start_time + timedelta(minutes=i * step_minutes) for i in ok]
     }
 
-def propagate_multiple(satellites, start_time=None, duration_hours=24, step_minutes=10):
-    """Propagate multiple satellites."""
-    results = []
+def parse_satellites(satellites):
+    """
+    Parse TLEs once for reuse across propagation calls.
+    Returns dict with parallel 'names' and 'catalogs' lists and the matching
+    'satrec_array' (None if nothing parsed); bad entries are skipped.
+    """
+    names = []
+    catalogs = []
+    satrecs = []
     for sat in satellites:
         try:
-            result = propagate_satellite(sat, start_time, duration_hours, step_minutes)
-            if result['positions']:
-                results.append(result)
+            satrecs.append(_get_satrec(sat))
         except Exception as e:
             print(f"Error propagating {sat.get('name', 'unknown')}: {e}")
+            continue
+        names.append(sat['name'])
+        catalogs.append(sat.get('catalog', 'unknown'))
+    return {
+        'names': names,
+        'catalogs': catalogs,
+        'satrec_array': SatrecArray(satrecs) if satrecs else None
+    }
+
+def propagate_batch(satellites, start_time=None, duration_hours=24, step_minutes=10, parsed=None):
+    """
+    Propagate multiple satellites over a shared timeline in a single SGP4 call.
+    Returns dict of arrays: 'positions' has shape (n_sats, n_steps, 3) in ECI
+    coordinates (km), with NaN wherever SGP4 reported an error ('valid' is False).
+    Pass parsed (from parse_satellites) to skip re-parsing the TLEs.
+    """
+    if parsed is None:
+        parsed = parse_satellites(satellites)
+    names, catalogs, satrec_array = parsed['names'], parsed['catalogs'], parsed['satrec_array']
+    
+    if start_time is None:
+        start_time = datetime.utcnow()
+    
+    steps = int((duration_hours * 60) / step_minutes)
+    times = [start_time + timedelta(minutes=i * step_minutes) for i in range(steps)]
+    
+    # One C-level call covers every satellite and step. sgp4 holds the GIL
+    # throughout, so thread pools gain nothing, and at catalog sizes the call
+    # finishes well before a process pool could even start its workers.
+    if satrec_array is not None:
+        jd, fr = compute_jd_grid(start_time, steps, step_minutes)
+        errors, positions, velocities = satrec_array.sgp4(jd, fr)
+    else:
+        errors = np.zeros((0, steps), dtype=np.uint8)
+        positions = np.zeros((0, steps, 3))
+    
+    valid = errors == 0
+    positions[~valid] = np.nan
+    
+    return {
+        'names': names,
+        'catalogs': catalogs,
+        'times': times,
+        'positions': positions,
+        'valid': valid
+    }
+
+def propagate_multiple(satellites, start_time=None, duration_hours=24, step_minutes=10, parsed=None):
+    """
+    Propagate multiple satellites.
+    Each result's positions is a float32 (n_steps, 3) array; satellites with
+    no failed steps share one contiguous (n_sats, n_steps, 3) block.
+    """
+    batch = propagate_batch(satellites, start_time, duration_hours, step_minutes, parsed)
+    all_positions = batch['positions'].astype(np.float32)
+    
+    results = []
+    for name, catalog, positions, valid in zip(
+        batch['names'], batch['catalogs'], all_positions, batch['valid']
+    ):
+        ok = np.flatnonzero(valid).tolist()
+        if ok:
+            results.append({
+                'name': name,
+                'catalog': catalog,
+                'positions': positions if len(ok) == len(valid) else positions[ok],
+                'times': [batch['times'][i] for i in ok]
+            })
     return results
 
 def get_current_position(tle_data, at_time=None):
@@ -56,7 +152,7 @@ def get_current_position(tle_data, at_time=None):
     if at_time is None:
         at_time = datetime.utcnow()
     
-    satellite = Satrec.twoline2rv(tle_data['line1'], tle_data['line2'])
+    satellite = _get_satrec(tle_data)
     jd, fr = jday(
         at_time.year, at_time.month, at_time.day,
         at_time.hour, at_time.minute, at_time.second
@@ -65,7 +161,7 @@ def get_current_position(tle_data, at_time=None):
     error, position, velocity = satellite.sgp4(jd, fr)
     
     if error == 0:
-        altitude = np.sqrt(sum(p**2 for p in position)) - EARTH_RADIUS_KM
+        altitude = math.hypot(*position) - EARTH_RADIUS_KM
         return {
             'position': position,
             'velocity': velocity,
@@ -73,3 +169,35 @@ def get_current_position(tle_data, at_time=None):
             'time': at_time
         }
     return None
+
+def get_current_positions(satellites, at_time=None, parsed=None):
+    """
+    Get positions of multiple satellites at a specific time.
+    Returns dict of parallel arrays (names, catalogs, positions, altitudes),
+    omitting satellites SGP4 could not propagate.
+    """
+    if at_time is None:
+        at_time = datetime.utcnow()
+    
+    if parsed is None:
+        parsed = parse_satellites(satellites)
+    names, catalogs, satrec_array = parsed['names'], parsed['catalogs'], parsed['satrec_array']
+    
+    if satrec_array is not None:
+        jd, fr = compute_jd_grid(at_time, 1, 0)
+        errors, positions, velocities = satrec_array.sgp4(jd, fr)
+        errors, positions = errors[:, 0], positions[:, 0]
+    else:
+        errors = np.zeros(0, dtype=np.uint8)
+        positions = np.zeros((0, 3))
+    
+    valid = errors == 0
+    positions = positions[valid]
+    
+    return {
+        'names': np.array(names, dtype=object)[valid],
+        'catalogs': np.array(catalogs, dtype=object)[valid],
+        'positions': positions.astype(np.float32),
+        'altitudes': (np.linalg.norm(positions, axis=-1) - EARTH_RADIUS_KM).astype(np.float32),
+        'time': at_time
+    }
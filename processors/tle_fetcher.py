@@ -1,5 +1,17 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
 
 TLE_SOURCES = [
     {
@@ -26,126 +38,121 @@ CATALOGS = {
     "debris": "debris",
 }
 
-FALLBACK_TLE_DATA = {
-    "stations": [
-        {
-            "name": "ISS (ZARYA)",
-            "line1": "1 25544U 98067A   24001.50000000  .00016717  00000-0  10270-3 0  9993",
-            "line2": "2 25544  51.6400 208.9163 0006703 296.7361  63.3006 15.49560922431058",
-            "catalog": "stations"
-        },
-        {
-            "name": "TIANGONG",
-            "line1": "1 48274U 21035A   24001.50000000  .00017234  00000-0  20343-3 0  9992",
-            "line2": "2 48274  41.4700 290.5642 0006428 322.0843  37.9697 15.62039567147556",
-            "catalog": "stations"
-        },
-    ],
-    "starlink": [
-        {
-            "name": "STARLINK-1007",
-            "line1": "1 44713U 19074A   24001.50000000  .00001234  00000-0  12345-4 0  9991",
-            "line2": "2 44713  53.0540 120.6789 0001234  90.1234 270.0000 15.06391234  5678",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1008",
-            "line1": "1 44714U 19074B   24001.50000000  .00001234  00000-0  12345-4 0  9990",
-            "line2": "2 44714  53.0540 125.6789 0001234  95.1234 265.0000 15.06391234  5679",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1009",
-            "line1": "1 44715U 19074C   24001.50000000  .00001234  00000-0  12345-4 0  9999",
-            "line2": "2 44715  53.0540 130.6789 0001234 100.1234 260.0000 15.06391234  5670",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1010",
-            "line1": "1 44716U 19074D   24001.50000000  .00001234  00000-0  12345-4 0  9998",
-            "line2": "2 44716  53.0540 135.6789 0001234 105.1234 255.0000 15.06391234  5671",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1011",
-            "line1": "1 44717U 19074E   24001.50000000  .00001234  00000-0  12345-4 0  9997",
-            "line2": "2 44717  53.0540 140.6789 0001234 110.1234 250.0000 15.06391234  5672",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1012",
-            "line1": "1 44718U 19074F   24001.50000000  .00001234  00000-0  12345-4 0  9996",
-            "line2": "2 44718  53.0540 145.6789 0001234 115.1234 245.0000 15.06391234  5673",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1013",
-            "line1": "1 44719U 19074G   24001.50000000  .00001234  00000-0  12345-4 0  9995",
-            "line2": "2 44719  53.0540 150.6789 0001234 120.1234 240.0000 15.06391234  5674",
-            "catalog": "starlink"
-        },
-        {
-            "name": "STARLINK-1014",
-            "line1": "1 44720U 19074H   24001.50000000  .00001234  00000-0  12345-4 0  9994",
-            "line2": "2 44720  53.0540 155.6789 0001234 125.1234 235.0000 15.06391234  5675",
-            "catalog": "starlink"
-        },
-    ],
-    "debris": [
-        {
-            "name": "COSMOS 2251 DEB",
-            "line1": "1 33442U 93036SX  24001.50000000  .00000234  00000-0  23456-4 0  9991",
-            "line2": "2 33442  74.0366 200.1234 0012345 234.5678 125.4321 14.12345678  1234",
-            "catalog": "debris"
-        },
-        {
-            "name": "COSMOS 2251 DEB [2]",
-            "line1": "1 33443U 93036SY  24001.50000000  .00000234  00000-0  23456-4 0  9990",
-            "line2": "2 33443  74.0366 205.1234 0012345 239.5678 120.4321 14.12345678  1235",
-            "catalog": "debris"
-        },
-        {
-            "name": "IRIDIUM 33 DEB",
-            "line1": "1 33444U 97051SX  24001.50000000  .00000234  00000-0  23456-4 0  9999",
-            "line2": "2 33444  86.4000 180.1234 0012345 244.5678 115.4321 14.34567890  1236",
-            "catalog": "debris"
-        },
-        {
-            "name": "IRIDIUM 33 DEB [2]",
-            "line1": "1 33445U 97051SY  24001.50000000  .00000234  00000-0  23456-4 0  9998",
-            "line2": "2 33445  86.4000 185.1234 0012345 249.5678 110.4321 14.34567890  1237",
-            "catalog": "debris"
-        },
-        {
-            "name": "FENGYUN 1C DEB",
-            "line1": "1 29479U 99025DKB 24001.50000000  .00000234  00000-0  23456-4 0  9997",
-            "line2": "2 29479  98.7000 250.1234 0012345 254.5678 105.4321 14.56789012  1238",
-            "catalog": "debris"
-        },
-        {
-            "name": "FENGYUN 1C DEB [2]",
-            "line1": "1 29480U 99025DKC 24001.50000000  .00000234  00000-0  23456-4 0  9996",
-            "line2": "2 29480  98.7000 255.1234 0012345 259.5678 100.4321 14.56789012  1239",
-            "catalog": "debris"
-        },
-    ]
-}
+# Demo data lives in a JSON file next to this module and is only read the
+# first time a fallback is needed
+FALLBACK_TLE_PATH = Path(__file__).with_name("fallback_tle.json")
+_fallback_data = None
+
+def _load_fallback_data():
+    """Load and freeze the fallback TLE data on first use."""
+    global _fallback_data
+    
+    if _fallback_data is None:
+        with open(FALLBACK_TLE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        # Frozen so fallback results can share entries without copying
+        _fallback_data = MappingProxyType({k: tuple(v) for k, v in data.items()})
+    return _fallback_data
+
+FALLBACK_SOURCE = "Cached demo data"
 
 _using_fallback = False
 _last_error = None
 _data_source = None
 
-def fetch_from_tle_api(catalog_name, limit):
-    """Fetch from TLE API (public CelesTrak mirror)."""
+# Live TLE results keyed by (catalog_name, limit); TLEs change over hours,
+# so repeated fetches within the TTL are served from memory
+TLE_CACHE_TTL = 1800
+_tle_cache = {}
+_tle_cache_lock = threading.Lock()
+
+# Live results also persist on disk across restarts when diskcache is
+# installed; the cache is opened on first use, next to this module
+TLE_DISK_CACHE_DIR = Path(__file__).with_name(".tle_cache")
+_disk_cache = None
+_disk_cache_opened = False
+
+# Guards the status globals above; fetch_multiple_catalogs fetches from
+# worker threads
+_status_lock = threading.Lock()
+
+# One circuit breaker per source host: after CIRCUIT_FAIL_LIMIT consecutive
+# failures that source is skipped for CIRCUIT_COOLDOWN seconds, so during a
+# full outage fetches go straight to demo data
+CIRCUIT_FAIL_LIMIT = 3
+CIRCUIT_COOLDOWN = 60
+_circuits = {
+    "tle_api": {"fails": 0, "open_until": 0.0},
+    "celestrak": {"fails": 0, "open_until": 0.0},
+}
+
+def _circuit_is_open(tier):
+    """Check whether a source is currently being skipped."""
+    with _status_lock:
+        return time.monotonic() < _circuits[tier]["open_until"]
+
+def _record_circuit(tier, success):
+    """Reset a source's failure count on success, or open its circuit after repeated failures."""
+    with _status_lock:
+        circuit = _circuits[tier]
+        if success:
+            circuit["fails"] = 0
+            circuit["open_until"] = 0.0
+        else:
+            circuit["fails"] += 1
+            if circuit["fails"] >= CIRCUIT_FAIL_LIMIT:
+                circuit["open_until"] = time.monotonic() + CIRCUIT_COOLDOWN
+
+# (connect, read) seconds. 3s covers RTT plus TLS handshake even on mobile
+# networks; the read timeout applies per socket read and leaves room for
+# large page_size responses. Timeouts are never retried (see
+# _create_session), so an unreachable host fails a tier after 3s and a
+# server that stops answering after 8s; only 502/503/504 responses add
+# retries, with under a second of backoff
+HTTP_TIMEOUT = (3.0, 8.0)
+
+# Transient gateway errors are retried with exponential backoff, by both the
+# requests session and the async fetch
+RETRY_STATUSES = (502, 503, 504)
+RETRY_ATTEMPTS = 2
+RETRY_BACKOFF = 0.3
+
+def _create_session():
+    """Shared HTTP session: keep-alive connection pooling, compressed responses and retries."""
+    session = requests.Session()
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": "spacedebbie/1.0"
+    })
+    # Only status codes are retried: connect and read timeouts fail straight
+    # through so HTTP_TIMEOUT bounds each tier, and the circuit breaker handles
+    # hosts that stay down
+    retry = Retry(
+        total=RETRY_ATTEMPTS, connect=0, read=False, other=0, status=RETRY_ATTEMPTS,
+        backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=False
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+_session = _create_session()
+
+def _tle_api_url(catalog_name, limit):
+    """Build the TLE API search URL for a catalog."""
     mapping = CATALOG_MAPPINGS.get(catalog_name, {"search": catalog_name, "page_size": limit})
     search_term = mapping["search"]
 
-    url = f"https://tle.ivanstanojevic.me/api/tle/?search={search_term}&page_size={limit}"
-    
-    response = requests.get(url, timeout=15, allow_redirects=True)
+    return f"https://tle.ivanstanojevic.me/api/tle/?search={search_term}&page_size={limit}"
+
+def fetch_from_tle_api(catalog_name, limit):
+    """Fetch from TLE API (public CelesTrak mirror)."""
+    response = _session.get(_tle_api_url(catalog_name, limit), timeout=HTTP_TIMEOUT, allow_redirects=True)
     response.raise_for_status()
     
-    data = response.json()
+    return _parse_tle_api_response(response.json(), catalog_name)
+
+def _parse_tle_api_response(data, catalog_name):
+    """Convert a TLE API JSON response into satellite dicts."""
     satellites = []
     
     for item in data.get("member", []):
@@ -158,6 +165,21 @@ def fetch_from_tle_api(catalog_name, limit):
     
     return satellites
 
+# Checksum value of each byte: digits count as themselves, '-' as 1, all else 0
+_CHECKSUM_VALUES = bytes(
+    c - 48 if 48 <= c <= 57 else 1 if c == 45 else 0 for c in range(256)
+)
+
+def tle_checksum(line):
+    """Modulo-10 checksum over the first 68 columns of a TLE line."""
+    if isinstance(line, str):
+        line = line.encode('ascii', 'replace')
+    return sum(line[:68].translate(_CHECKSUM_VALUES)) % 10
+
+def is_valid_tle_line(line):
+    """Check a TLE line's length and its column-69 checksum digit."""
+    return len(line) >= 69 and line[68] in "0123456789" and tle_checksum(line) == int(line[68])
+
 def fetch_from_celestrak(catalog_name, limit):
     """Fetch from CelesTrak using the new API format."""
     mapping = CATALOG_MAPPINGS.get(catalog_name, {"celestrak_group": "stations"})
@@ -165,7 +187,7 @@ def fetch_from_celestrak(catalog_name, limit):
 
     url = f"https://celestrak.org/NORAD/elements/gp.php?GROUP={group}&FORMAT=tle"
     
-    response = requests.get(url, timeout=15, allow_redirects=True)
+    response = _session.get(url, timeout=HTTP_TIMEOUT, allow_redirects=True)
     response.raise_for_status()
 
     lines = response.text.strip().split('\n')
@@ -178,8 +200,9 @@ def fetch_from_celestrak(catalog_name, limit):
             line1 = lines[i + 1].strip()
             line2 = lines[i + 2].strip()
             
-            # Validate TLE format
-            if line1.startswith('1 ') and line2.startswith('2 '):
+            # Validate TLE format and checksums
+            if (line1.startswith('1 ') and line2.startswith('2 ')
+                    and is_valid_tle_line(line1) and is_valid_tle_line(line2)):
                 satellites.append({
                     "name": name,
                     "line1": line1,
@@ -192,41 +215,166 @@ def fetch_from_celestrak(catalog_name, limit):
     
     return satellites
 
+def _get_disk_cache():
+    """Open the on-disk cache on first use; None without diskcache or if it can't be opened."""
+    global _disk_cache, _disk_cache_opened
+    
+    with _tle_cache_lock:
+        if not _disk_cache_opened:
+            _disk_cache_opened = True
+            try:
+                import diskcache
+                _disk_cache = diskcache.Cache(str(TLE_DISK_CACHE_DIR))
+            except ImportError:
+                pass
+            except Exception as e:
+                log.warning("Disk TLE cache unavailable: %s", e)
+    return _disk_cache
+
+def _store_cached(key, satellites, source):
+    """Remember a live fetch result for TLE_CACHE_TTL seconds."""
+    with _tle_cache_lock:
+        _tle_cache[key] = (time.monotonic(), list(satellites), source)
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.set("%s:%s" % key, (list(satellites), source), expire=TLE_CACHE_TTL)
+
+def invalidate_tle_cache():
+    """Drop all cached TLE results so the next fetch goes to the network."""
+    with _tle_cache_lock:
+        _tle_cache.clear()
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear()
+
+def _get_cached(key):
+    """Return (satellites copy, source) for a still-fresh cached live result, or None."""
+    cached = _get_memory_cached(key)
+    if cached is None:
+        cached = _get_disk_cached(key)
+    return cached
+
+def _get_memory_cached(key):
+    """In-memory half of _get_cached; never blocks on I/O."""
+    with _tle_cache_lock:
+        cached = _tle_cache.get(key)
+    if cached and time.monotonic() - cached[0] < TLE_CACHE_TTL:
+        _, satellites, source = cached
+        return list(satellites), source
+    return None
+
+def _get_disk_cached(key):
+    """On-disk half of _get_cached; back-fills the memory cache on a hit."""
+    disk_cache = _get_disk_cache()
+    if disk_cache is None:
+        return None
+    cached, expire_time = disk_cache.get("%s:%s" % key, expire_time=True)
+    if not cached:
+        return None
+    satellites, source = cached
+    # Dated so the memory entry expires when the disk entry does
+    stored_at = time.monotonic() - (TLE_CACHE_TTL - (expire_time - time.time()))
+    with _tle_cache_lock:
+        _tle_cache[key] = (stored_at, list(satellites), source)
+    return list(satellites), source
+
+def _record_live(key, satellites, source):
+    """Clear the last error after a live fetch and cache its result."""
+    global _last_error
+    
+    with _status_lock:
+        _last_error = None
+    _store_cached(key, satellites, source)
+
+def _record_error(e):
+    """Remember the most recent fetch error."""
+    global _last_error
+    
+    with _status_lock:
+        _last_error = str(e)
+
+def _set_status(sources):
+    """Publish the combined outcome of one fetch call; demo data in any catalog counts as fallback."""
+    global _using_fallback, _data_source
+    
+    with _status_lock:
+        _using_fallback = FALLBACK_SOURCE in sources
+        _data_source = " + ".join(dict.fromkeys(sources)) or None
+
 def fetch_tle_data(catalog_name="stations", limit=50):
     """
     Fetch TLE data from available sources.
-    Tries TLE API first, then CelesTrak, then falls back to cached data.
+    Returns a recent live result if one is cached, otherwise tries TLE API,
+    then CelesTrak (each skipped while its circuit breaker is open), then
+    falls back to cached demo data.
     """
-    global _using_fallback, _last_error, _data_source
+    satellites, source = _fetch_tle_data(catalog_name, limit)
+    _set_status([source])
+    return satellites
+
+def _fetch_tle_data(catalog_name, limit):
+    """fetch_tle_data without touching the shared status; returns (satellites, source)."""
+    key = (catalog_name, limit)
+    cached = _get_cached(key)
+    if cached is not None:
+        return cached
     
-    try:
-        satellites = fetch_from_tle_api(catalog_name, limit)
-        if satellites:
-            _using_fallback = False
-            _last_error = None
-            _data_source = "TLE API (live data)"
-            print(f"Successfully fetched {len(satellites)} objects from TLE API for {catalog_name}")
-            return satellites
-    except Exception as e:
-        _last_error = str(e)
-        print(f"TLE API unavailable ({catalog_name}): {e}")
+    if _tle_api_available(catalog_name):
+        try:
+            satellites = fetch_from_tle_api(catalog_name, limit)
+        except Exception as e:
+            _tle_api_failed(catalog_name, e)
+        else:
+            result = _tle_api_succeeded(key, satellites)
+            if result is not None:
+                return result
     
-    try:
-        satellites = fetch_from_celestrak(catalog_name, limit)
-        if satellites:
-            _using_fallback = False
-            _last_error = None
-            _data_source = "CelesTrak (live data)"
-            print(f"Successfully fetched {len(satellites)} objects from CelesTrak for {catalog_name}")
-            return satellites
-    except Exception as e:
-        _last_error = str(e)
-        print(f"CelesTrak unavailable ({catalog_name}): {e}")
+    return _fetch_celestrak_or_fallback(catalog_name, limit)
+
+# TLE API tier bookkeeping, shared by the sync and async fetch paths; only
+# the request itself differs between them
+
+def _tle_api_available(catalog_name):
+    """Check the circuit breaker before trying the TLE API."""
+    if _circuit_is_open("tle_api"):
+        log.info("Skipping TLE API for %s while its circuit is open", catalog_name)
+        return False
+    return True
+
+def _tle_api_failed(catalog_name, e):
+    """Record a failed TLE API request."""
+    _record_circuit("tle_api", False)
+    _record_error(e)
+    log.warning("TLE API unavailable (%s): %s", catalog_name, e)
+
+def _tle_api_succeeded(key, satellites):
+    """Record a TLE API response; returns (satellites, source), or None if it was empty."""
+    _record_circuit("tle_api", True)
+    if not satellites:
+        return None
+    _record_live(key, satellites, "TLE API (live data)")
+    log.info("Fetched %d objects from TLE API for %s", len(satellites), key[0])
+    return satellites, "TLE API (live data)"
+
+def _fetch_celestrak_or_fallback(catalog_name, limit):
+    """The CelesTrak and demo-data tiers of fetch_tle_data; returns (satellites, source)."""
+    if _circuit_is_open("celestrak"):
+        log.info("Skipping CelesTrak for %s while its circuit is open", catalog_name)
+    else:
+        try:
+            satellites = fetch_from_celestrak(catalog_name, limit)
+            _record_circuit("celestrak", True)
+            if satellites:
+                _record_live((catalog_name, limit), satellites, "CelesTrak (live data)")
+                log.info("Fetched %d objects from CelesTrak for %s", len(satellites), catalog_name)
+                return satellites, "CelesTrak (live data)"
+        except Exception as e:
+            _record_circuit("celestrak", False)
+            _record_error(e)
+            log.warning("CelesTrak unavailable (%s): %s", catalog_name, e)
     
-    _using_fallback = True
-    _data_source = "Cached demo data"
-    print(f"Using fallback demo data for {catalog_name}")
-    return get_fallback_data(catalog_name, limit)
+    log.warning("Using fallback demo data for %s", catalog_name)
+    return get_fallback_data(catalog_name, limit), FALLBACK_SOURCE
 
 def get_fallback_data(catalog_name, limit=50):
     """Get fallback TLE data when external sources are unavailable."""
@@ -240,15 +388,14 @@ def get_fallback_data(catalog_name, limit=50):
     }
     
     fallback_key = catalog_map.get(catalog_name, "stations")
-    fallback_sats = FALLBACK_TLE_DATA.get(fallback_key, [])
+    fallback_sats = _load_fallback_data().get(fallback_key, ())
     
-    result = []
-    for sat in fallback_sats[:limit]:
-        sat_copy = sat.copy()
-        sat_copy['catalog'] = catalog_name
-        result.append(sat_copy)
+    # Canonical catalogs share their entries rather than copying them;
+    # callers must treat returned satellites as read-only
+    if fallback_key == catalog_name:
+        return list(fallback_sats[:limit])
     
-    return result
+    return [{**sat, 'catalog': catalog_name} for sat in fallback_sats[:limit]]
 
 def is_using_fallback():
     """Check if fallback data is currently being used."""
@@ -264,12 +411,85 @@ def get_data_source():
 
 def fetch_multiple_catalogs(catalogs=None, limit_per_catalog=20):
     """Fetch from multiple catalogs and combine."""
+    return fetch_multiple_catalogs_with_status(catalogs, limit_per_catalog)[0]
+
+def fetch_multiple_catalogs_with_status(catalogs=None, limit_per_catalog=20):
+    """
+    Fetch from multiple catalogs and combine.
+    Returns (satellites, using_fallback), where using_fallback is True if any
+    catalog fell back to demo data.
+    """
+    if catalogs is None:
+        catalogs = ["stations", "starlink", "debris"]
+    
+    # Each fetch is network-bound and independent, so fan them out; map()
+    # keeps results in catalog order
+    with ThreadPoolExecutor(max_workers=max(1, len(catalogs))) as executor:
+        results = list(executor.map(lambda cat: _fetch_tle_data(cat, limit_per_catalog), catalogs))
+    
+    # Status is combined once all workers finish, so it doesn't depend on
+    # which thread happened to finish last
+    sources = [source for _, source in results]
+    _set_status(sources)
+    
+    return [sat for sats, _ in results for sat in sats], FALLBACK_SOURCE in sources
+
+async def _afetch_from_tle_api(session, catalog_name, limit):
+    """Async fetch from TLE API on a shared aiohttp session, retrying transient errors."""
+    url = _tle_api_url(catalog_name, limit)
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        async with session.get(url) as response:
+            if response.status in RETRY_STATUSES and attempt < RETRY_ATTEMPTS:
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                continue
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+        return _parse_tle_api_response(data, catalog_name)
+
+async def _afetch_tle_data(session, catalog_name, limit):
+    """
+    Async fetch_tle_data; returns (satellites, source).
+    The TLE API request runs on the event loop; only blocking work (disk
+    cache, CelesTrak and demo-data tiers) goes to a worker thread.
+    """
+    key = (catalog_name, limit)
+    cached = _get_memory_cached(key)
+    if cached is None:
+        cached = await asyncio.to_thread(_get_disk_cached, key)
+    if cached is not None:
+        return cached
+    
+    if _tle_api_available(catalog_name):
+        try:
+            satellites = await _afetch_from_tle_api(session, catalog_name, limit)
+        except Exception as e:
+            _tle_api_failed(catalog_name, e)
+        else:
+            # Storing the result may write the disk cache
+            result = await asyncio.to_thread(_tle_api_succeeded, key, satellites)
+            if result is not None:
+                return result
+    
+    return await asyncio.to_thread(_fetch_celestrak_or_fallback, catalog_name, limit)
+
+async def afetch_multiple_catalogs(catalogs=None, limit_per_catalog=20):
+    """
+    Async variant of fetch_multiple_catalogs for large catalog fan-outs.
+    All TLE API requests share one aiohttp session on the running event loop
+    instead of one thread each. Requires aiohttp.
+    """
+    import aiohttp
+    
     if catalogs is None:
         catalogs = ["stations", "starlink", "debris"]
     
-    all_satellites = []
-    for cat in catalogs:
-        sats = fetch_tle_data(cat, limit=limit_per_catalog)
-        all_satellites.extend(sats)
+    async with aiohttp.ClientSession(
+        headers={"Accept-Encoding": "gzip, deflate", "User-Agent": "spacedebbie/1.0"},
+        timeout=aiohttp.ClientTimeout(connect=HTTP_TIMEOUT[0], sock_read=HTTP_TIMEOUT[1])
+    ) as session:
+        results = await asyncio.gather(
+            *[_afetch_tle_data(session, cat, limit_per_catalog) for cat in catalogs]
+        )
     
-    return all_satellites
+    _set_status([source for _, source in results])
+    return [sat for sats, _ in results for sat in sats]
@@ -1,19 +1,27 @@
-import plotly.graph_objects as go
+import math
 import numpy as np
 
 EARTH_RADIUS_KM = 6371.0
+MAX_ORBIT_SEGMENTS = 256
+# Decimation never leaves fewer points than this per revolution, so thinned
+# orbits still draw as smooth curves
+MIN_POINTS_PER_ORBIT = 36
+EARTH_MU_KM3_S2 = 398600.4418
+
+# The Earth mesh never changes, so build it once at import
+_u = np.linspace(0, 2 * np.pi, 50)
+_v = np.linspace(0, np.pi, 50)
+_EARTH_X = (EARTH_RADIUS_KM * np.outer(np.cos(_u), np.sin(_v))).astype(np.float32)
+_EARTH_Y = (EARTH_RADIUS_KM * np.outer(np.sin(_u), np.sin(_v))).astype(np.float32)
+_EARTH_Z = (EARTH_RADIUS_KM * np.outer(np.ones(np.size(_u)), np.cos(_v))).astype(np.float32)
+del _u, _v
 
 def create_earth_sphere():
     """Create a 3D sphere representing Earth."""
-    u = np.linspace(0, 2 * np.pi, 50)
-    v = np.linspace(0, np.pi, 50)
-    
-    x = EARTH_RADIUS_KM * np.outer(np.cos(u), np.sin(v))
-    y = EARTH_RADIUS_KM * np.outer(np.sin(u), np.sin(v))
-    z = EARTH_RADIUS_KM * np.outer(np.ones(np.size(u)), np.cos(v))
+    import plotly.graph_objects as go
     
     return go.Surface(
-        x=x, y=y, z=z,
+        x=_EARTH_X, y=_EARTH_Y, z=_EARTH_Z,
         colorscale=[[0, '#1E90FF'], [0.5, '#228B22'], [1, '#1E90FF']],
         showscale=False,
         opacity=0.8,
@@ -21,28 +29,57 @@ def create_earth_sphere():
         hoverinfo='skip'
     )
 
+_CATALOG_IDS = {
+    'stations': 0,
+    'starlink': 1,
+    'active': 2,
+    'debris': 3,
+    'cosmos-2251-debris': 4,
+    'iridium-33-debris': 5,
+    'unknown': 6
+}
+_ORBIT_COLORS = ('#00FF00', '#FFD700', '#00BFFF', '#FF4500', '#FF0000', '#FF6347', '#FFFFFF')
+
+# Shared hover templates; per-trace values come from meta (trace-level, so
+# every point of an orbit line sees it) or customdata (the single marker point)
+_ORBIT_HOVERTEMPLATE = "<b>%{meta[0]}</b><br>Type: %{meta[1]}<extra></extra>"
+_POSITION_HOVERTEMPLATE = "<b>%{customdata[0]}</b><br>Altitude: %{customdata[1]:.0f} km<br>Type: %{customdata[2]}<extra></extra>"
+
 def get_orbit_color(catalog):
     """Get color based on object type."""
-    colors = {
-        'stations': '#00FF00',
-        'starlink': '#FFD700',
-        'active': '#00BFFF',
-        'debris': '#FF4500',
-        'cosmos-2251-debris': '#FF0000',
-        'iridium-33-debris': '#FF6347',
-        'unknown': '#FFFFFF'
-    }
-    return colors.get(catalog, '#FFFFFF')
+    return _ORBIT_COLORS[_CATALOG_IDS.get(catalog, 6)]
+
+def _orbit_stride(positions, times):
+    """
+    Decimation stride for an orbit trace: aims for MAX_ORBIT_SEGMENTS points
+    but keeps at least MIN_POINTS_PER_ORBIT per revolution.
+    """
+    if len(positions) <= MAX_ORBIT_SEGMENTS or len(times) < 2:
+        return 1
+    
+    step_s = (times[-1] - times[0]).total_seconds() / (len(times) - 1)
+    radius_km = float(np.linalg.norm(positions, axis=-1).mean())
+    period_s = 2 * math.pi * math.sqrt(radius_km ** 3 / EARTH_MU_KM3_S2)
+    max_stride = int(period_s / step_s / MIN_POINTS_PER_ORBIT)
+    
+    return max(1, min(math.ceil(len(positions) / MAX_ORBIT_SEGMENTS), max_stride))
 
 def create_orbit_trace(propagation_result):
-    """Create a 3D line trace for an orbit."""
-    positions = propagation_result['positions']
-    if not positions:
+    """
+    Create a 3D line trace for an orbit.
+    Densely sampled orbits are thinned (see _orbit_stride) unless the result
+    sets decimate=False.
+    """
+    import plotly.graph_objects as go
+    
+    positions = np.asarray(propagation_result['positions'], dtype=np.float32)
+    if len(positions) == 0:
         return None
     
-    x = [p[0] for p in positions]
-    y = [p[1] for p in positions]
-    z = [p[2] for p in positions]
+    if propagation_result.get('decimate', True):
+        positions = positions[::_orbit_stride(positions, propagation_result.get('times', []))]
+    
+    x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
     
     color = get_orbit_color(propagation_result.get('catalog', 'unknown'))
     
@@ -50,51 +87,72 @@ def create_orbit_trace(propagation_result):
         x=x, y=y, z=z,
         mode='lines',
         line=dict(color=color, width=2),
+        connectgaps=False,
         name=propagation_result['name'],
-        hovertemplate=f"<b>{propagation_result['name']}</b><br>Type: {propagation_result.get('catalog', 'unknown')}<extra></extra>"
+        meta=[propagation_result['name'], propagation_result.get('catalog', 'unknown')],
+        hovertemplate=_ORBIT_HOVERTEMPLATE
     )
 
 def create_current_position_marker(name, position, catalog, altitude):
     """Create a marker for current satellite position."""
+    import plotly.graph_objects as go
+    
+    position = np.asarray(position, dtype=np.float32)
     color = get_orbit_color(catalog)
     
     return go.Scatter3d(
-        x=[position[0]],
-        y=[position[1]],
-        z=[position[2]],
+        x=position[0:1],
+        y=position[1:2],
+        z=position[2:3],
         mode='markers',
         marker=dict(size=8, color=color, symbol='diamond'),
         name=f"{name} (now)",
-        hovertemplate=f"<b>{name}</b><br>Altitude: {altitude:.0f} km<br>Type: {catalog}<extra></extra>"
+        customdata=[[name, float(altitude), catalog]],
+        hovertemplate=_POSITION_HOVERTEMPLATE
     )
 
 def create_3d_visualization(propagation_results, current_positions=None, conjunctions=None):
-    """Create full 3D visualization with Earth, orbits, and conjunctions."""
+    """
+    Create full 3D visualization with Earth, orbits, and conjunctions.
+    current_positions is the dict of arrays returned by get_current_positions.
+    """
+    import plotly.graph_objects as go
+    
     fig = go.Figure()
     
-    fig.add_trace(create_earth_sphere())
+    traces = [create_earth_sphere()]
+    
+    # Orbits involved in a close approach keep full resolution
+    conjunction_names = set()
+    for conj in conjunctions or ():
+        conjunction_names.update((conj['object1'], conj['object2']))
     
     for result in propagation_results:
+        if result['name'] in conjunction_names:
+            result = {**result, 'decimate': False}
         trace = create_orbit_trace(result)
         if trace:
-            fig.add_trace(trace)
+            traces.append(trace)
     
     if current_positions:
-        for pos_data in current_positions:
-            marker = create_current_position_marker(
-                pos_data['name'],
-                pos_data['position'],
-                pos_data.get('catalog', 'unknown'),
-                pos_data.get('altitude_km', 0)
+        traces.extend(
+            create_current_position_marker(name, position, catalog, altitude)
+            for name, position, catalog, altitude in zip(
+                current_positions['names'],
+                current_positions['positions'],
+                current_positions['catalogs'],
+                current_positions['altitudes']
             )
-            fig.add_trace(marker)
+        )
+    
+    fig.add_traces(traces)
     
     if conjunctions:
-        for conj in conjunctions[:5]:
+        for i, conj in enumerate(conjunctions[:5]):
             fig.add_annotation(
                 text=f"Close approach: {conj['distance_km']:.1f} km",
                 showarrow=False,
-                yref="paper", y=0.95 - conjunctions.index(conj) * 0.05
+                yref="paper", y=0.95 - i * 0.05
             )
     
     max_range = 15000